@@ -2,9 +2,199 @@
 
 import os
 import re
+import csv
+import sys
+import mmap
+import bisect
 import argparse
-import pandas as pd
-from bs4 import BeautifulSoup
+from lxml import etree
+from concurrent.futures import ProcessPoolExecutor
+
+# Hyperscan is an optional accelerator: it compiles all term patterns into a
+# single multi-pattern DFA and scans them simultaneously without backtracking.
+# When it is not installed, the pure-Python fused regexes below are used.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# pyahocorasick is a second optional accelerator: a single Aho-Corasick pass
+# finds every term in a string at once, replacing the per-term substring loop.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Comprehensive list of EPS synonyms, ordered by priority.
+EPS_TERMS = [
+    # Core EPS Terms
+    'earnings per basic share', 'basic earnings per share',
+    'earnings per common share - basic', 'earnings per share - basic',
+    'basic earnings per common share', 'earnings per common share',
+    'earnings per share', 'eps',
+    # Income-Based Variations
+    'basic income per share', 'basic net income per share',
+    'net income per share - basic', 'net income per common share - basic',
+    'income per common share', 'net income per common share', 'income per share',
+    'net income per share',
+    # Profit-Based Variations
+    'basic profit per share', 'profit per share',
+    # Loss-Based Variations
+    'basic loss per share', 'basic net loss per share',
+    'net loss per common share - basic', 'loss per share', 'net loss per share',
+    'net loss per common share', 'basic and diluted loss per share',
+    # Combined Earnings/Loss Variations
+    'earnings (loss) per basic share', 'earnings (loss) per share',
+    'earnings (loss) per common share', 'net income (loss) per share',
+    'net income (loss) per common share',
+    # "Attributable to" Variations
+    'earnings per share attributable to common stockholders',
+    'net income attributable to common stockholders per common share',
+    'net income per share available to common stockholders'
+]
+
+# Broader "per share" variations used by the last-resort fallback search.
+FALLBACK_TERMS = [
+    'per share', 'per basic share', 'per common share', 'per diluted share', 'per common stock'
+]
+
+TABLE_HEADERS = [
+    'consolidated statements of operations',
+    'consolidated statements of income',
+    'consolidated statements of comprehensive income',
+    'condensed consolidated statements of operations'
+]
+
+# Intern the term strings: they are hashed and compared constantly in the hot
+# loops, and interning reduces those to pointer comparisons.
+EPS_TERMS = [sys.intern(term) for term in EPS_TERMS]
+FALLBACK_TERMS = [sys.intern(term) for term in FALLBACK_TERMS]
+TABLE_HEADERS = [sys.intern(term) for term in TABLE_HEADERS]
+
+# Tags that can act as headers for the financial statement tables.
+_HEADER_TAGS = ('p', 'b', 'strong', 'div')
+
+# Collects the text nodes of a subtree in document order, skipping script and
+# style content (and comments, which are not text nodes) the same way
+# BeautifulSoup's get_text() does. Compiled once; join the result to get the
+# subtree's text.
+_TEXT_XPATH = etree.XPath(
+    './/text()[not(ancestor::script or ancestor::style)]', smart_strings=False)
+
+def _element_text(element):
+    """Returns the text content of an lxml element's subtree."""
+    return ''.join(_TEXT_XPATH(element))
+
+# Pre-compiled patterns: compiling once at import avoids re-parsing the same
+# regexes for every filing (and every term) on the hot fallback path.
+_NUMBER_RE = re.compile(r'\(?\s*\$?\s*(\d{1,3}(,\d{3})*|\d+)(\.\d{1,2})?\s*\)?')
+
+# All term patterns fused into one alternation so the full document text is
+# scanned once instead of once per term. Each term is its own group, so a
+# match's group index recovers the term's priority (its position in the list).
+# The alternation is wrapped in a lookahead so matches are zero-width: terms
+# that overlap (e.g. 'loss per share' inside 'net loss per share') are all
+# reported, matching the behaviour of the old per-term scans. The terms are
+# lowercase and the text is lowercased once per filing, so the patterns are
+# case-sensitive: one lower() pass is cheaper than caseless matching.
+_FUSED_TERM_RE = re.compile(
+    '(?=' + '|'.join(r'(\b' + re.escape(term) + r'\b)' for term in EPS_TERMS) + ')')
+_FUSED_FALLBACK_RE = re.compile(
+    '(?=' + '|'.join('(' + re.escape(term) + ')' for term in FALLBACK_TERMS) + ')')
+
+def _build_hs_db(patterns):
+    """Compiles a list of patterns into a Hyperscan database, or returns None
+    when Hyperscan is not available."""
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    db.compile(expressions=[p.encode('utf-8') for p in patterns],
+               ids=list(range(len(patterns))))
+    return db
+
+_HS_TERM_DB = _build_hs_db([r'\b' + re.escape(term) + r'\b' for term in EPS_TERMS])
+_HS_FALLBACK_DB = _build_hs_db([re.escape(term) for term in FALLBACK_TERMS])
+
+def _build_term_automaton(terms):
+    """Builds an Aho-Corasick automaton over the terms, or returns None when
+    pyahocorasick is not available. Each hit carries (priority, term)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, term in enumerate(terms):
+        automaton.add_word(term, (priority, term))
+    automaton.make_automaton()
+    return automaton
+
+_EPS_AUTOMATON = _build_term_automaton(EPS_TERMS)
+_FALLBACK_AUTOMATON = _build_term_automaton(FALLBACK_TERMS)
+
+def _is_word_char(ch):
+    """Mirrors what \\w matches in the re module (alphanumerics plus '_')."""
+    return ch.isalnum() or ch == '_'
+
+def _best_term_id(text):
+    """
+    Returns the id (index into EPS_TERMS) of the highest-priority EPS term
+    contained in the lowercased text, or None if no term is present. One
+    automaton pass replaces the per-term substring loop when pyahocorasick
+    is available.
+    """
+    # Literal prefilter: every EPS term contains 'share' or 'eps', so a text
+    # with neither anchor cannot match and the scan is skipped outright.
+    if 'share' not in text and 'eps' not in text:
+        return None
+    if _EPS_AUTOMATON is not None:
+        best_id = None
+        for _, (term_id, term) in _EPS_AUTOMATON.iter(text):
+            if best_id is None or term_id < best_id:
+                best_id = term_id
+        return best_id
+    for term_id, term in enumerate(EPS_TERMS):
+        if term in text:
+            return term_id
+    return None
+
+def _scan_for_terms(text, db, automaton, fused_re, whole_words=False):
+    """
+    Finds all term occurrences in the (lowercased) text in a single scan.
+    Returns a dict mapping each term's priority (its index in the term list)
+    to the end offsets of its occurrences in the text. With whole_words,
+    occurrences flanked by word characters are rejected, like \\b in a regex.
+    Uses Hyperscan, then pyahocorasick, then the fused regex, in order of
+    what is installed.
+    """
+    hits = {}
+    if db is not None:
+        # Hyperscan scans bytes and reports byte offsets. Encoding as latin-1
+        # (one byte per char, anything else replaced) keeps the reported
+        # offsets aligned with character offsets into the original text, so
+        # the context windows match the pure-Python path exactly.
+        data = text.encode('latin-1', 'replace')
+        def on_match(term_id, start, end, flags, context):
+            hits.setdefault(term_id, []).append(end)
+        db.scan(data, match_event_handler=on_match)
+        return hits
+    if automaton is not None:
+        # Aho-Corasick reports every occurrence of every term in one pass;
+        # a manual peek at the flanking characters stands in for the much
+        # more expensive \b handling in the regex engine.
+        last = len(text) - 1
+        for end, (priority, term) in automaton.iter(text):
+            if whole_words:
+                start = end - len(term) + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end < last and _is_word_char(text[end + 1]):
+                    continue
+            hits.setdefault(priority, []).append(end + 1)
+        return hits
+    for match in fused_re.finditer(text):
+        hits.setdefault(match.lastindex - 1, []).append(match.end(match.lastindex))
+    return hits
+
+# Removes currency symbols and commas in one C-level pass for robust parsing.
+_STRIP_TRANS = str.maketrans('', '', '$,')
 
 def extract_eps_value(text):
     """
@@ -13,184 +203,201 @@ def extract_eps_value(text):
     and ensures the value is plausible (e.g., between -25 and 25).
     """
     text = text.strip()
-    value = None
-    
+
     # Handle negative values in parentheses, e.g., (1.23) -> -1.23
-    if text.startswith('(') and text.endswith(')'):
-        try:
-            value = -float(text[1:-1])
-        except ValueError:
-            return None
-    # Handle regular positive or negative numbers
+    negative = text.startswith('(') and text.endswith(')')
+    if negative:
+        text = text[1:-1]
     else:
-        try:
-            # Remove currency symbols and commas for robust parsing
-            text = text.replace('$', '').replace(',', '')
-            value = float(text)
-        except ValueError:
-            return None
+        text = text.translate(_STRIP_TRANS)
+
+    try:
+        value = float(text)
+    except ValueError:
+        return None
+    if negative:
+        value = -value
 
     # Sanity check for bounds and format the output
-    if value is not None and -25 <= value <= 25:
+    if -25 <= value <= 25:
         return "{:.2f}".format(value)
     else:
         return None
 
+def _scan_table_rows(rows_data, found_values):
+    """
+    Scans one table's pre-extracted (row_text, cell_texts) rows for EPS
+    candidates, appending them to found_values. Returns (value, term) as soon
+    as a basic GAAP value turns up, since nothing later can outrank it, and
+    None otherwise. Operates purely on flat lists of strings, with no tree
+    access, so the hot prioritization loop stays tight and self-contained.
+    """
+    for i, (row_text_lower, cell_texts) in enumerate(rows_data):
+        # Find which term is in the row (our potential header row)
+        matched_id = _best_term_id(row_text_lower)
+
+        if matched_id is not None:
+            # First, try to find the value in the same row as the term.
+            value_found_in_header_row = False
+            for cell_text in cell_texts:
+                value = extract_eps_value(cell_text)
+                if value is not None:
+                    is_basic = 'basic' in row_text_lower
+                    is_gaap = 'gaap' in row_text_lower or 'unadjusted' in row_text_lower
+                    is_loss = 'loss' in row_text_lower or 'net loss' in row_text_lower
+                    if is_loss and not value.startswith('-'):
+                        value = '-' + value
+                    if is_basic and is_gaap:
+                        return value, EPS_TERMS[matched_id]
+                    found_values.append({'value': value, 'term_id': matched_id, 'is_basic': is_basic, 'is_gaap': is_gaap})
+                    value_found_in_header_row = True
+                    break # Found value in this row, no need to check other cells
+
+            # If no value was in the header row, search subsections in subsequent rows.
+            if not value_found_in_header_row:
+                # Look ahead up to 4 rows for the first numerical value.
+                for next_row_text_lower, next_cell_texts in rows_data[i+1 : i+5]:
+                    subsection_value_found = False
+                    for cell_text in next_cell_texts:
+                        value = extract_eps_value(cell_text)
+                        if value is not None:
+                            # This is the first numerical value in a subsequent row.
+                            is_basic = 'basic' in next_row_text_lower
+                            is_gaap = 'gaap' in next_row_text_lower or 'unadjusted' in next_row_text_lower
+                            is_loss = 'loss' in next_row_text_lower or 'net loss' in next_row_text_lower
+                            if is_loss and not value.startswith('-'):
+                                value = '-' + value
+
+                            if is_basic and is_gaap:
+                                return value, EPS_TERMS[matched_id]
+                            # Use the original term from the header row.
+                            found_values.append({'value': value, 'term_id': matched_id, 'is_basic': is_basic, 'is_gaap': is_gaap})
+                            subsection_value_found = True
+                            break # Stop after finding the first value in the row.
+
+                    if subsection_value_found:
+                        break # Stop looking ahead after finding a value in a subsection row.
+    return None
+
 def find_eps_in_file(file_path):
     """
     Finds the highest-priority EPS value and the term that was matched in an HTML file.
     Returns a tuple of (value, term).
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        soup = BeautifulSoup(content, 'html.parser')
-        
+        # Memory-map the file and stream-parse it: iterparse hands each
+        # relevant element over as its subtree completes, so the header scan
+        # happens during the parse and no BeautifulSoup object layer is built
+        # on top of the lxml tree.
+        header_starts = {header_text: [] for header_text in TABLE_HEADERS}
+        tables = []  # (preorder index, element) pairs
+        starts = {}
+        index = 0
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                context = etree.iterparse(
+                    content, events=('start', 'end'), html=True,
+                    encoding='utf-8', tag=('table',) + _HEADER_TAGS)
+                for event, element in context:
+                    if event == 'start':
+                        # Start events fire in document order, giving each
+                        # element its preorder position among relevant tags.
+                        starts[element] = index
+                        index += 1
+                    elif element.tag == 'table':
+                        tables.append((starts.pop(element), element))
+                    else:
+                        tag_text_lower = _element_text(element).lower()
+                        start = starts.pop(element)
+                        for header_text in TABLE_HEADERS:
+                            if header_text in tag_text_lower:
+                                header_starts[header_text].append(start)
+                root = context.root
+        # End events arrive in end order, so re-sort nested elements back
+        # into document order before resolving headers against tables.
+        tables.sort()
+        table_starts = [start for start, _ in tables]
+
         # --- Primary Search: Targeted Table Scan ---
         found_values = []
-        
-        # 1. Using the new comprehensive list of synonyms
-        eps_terms = [
-            # Core EPS Terms
-            'earnings per basic share', 'basic earnings per share',
-            'earnings per common share - basic', 'earnings per share - basic',
-            'basic earnings per common share', 'earnings per common share',
-            'earnings per share', 'eps',
-            # Income-Based Variations
-            'basic income per share', 'basic net income per share',
-            'net income per share - basic', 'net income per common share - basic',
-            'income per common share', 'net income per common share', 'income per share',
-            'net income per share',
-            # Profit-Based Variations
-            'basic profit per share', 'profit per share',
-            # Loss-Based Variations
-            'basic loss per share', 'basic net loss per share',
-            'net loss per common share - basic', 'loss per share', 'net loss per share',
-            'net loss per common share', 'basic and diluted loss per share',
-            # Combined Earnings/Loss Variations
-            'earnings (loss) per basic share', 'earnings (loss) per share',
-            'earnings (loss) per common share', 'net income (loss) per share',
-            'net income (loss) per common share',
-            # "Attributable to" Variations
-            'earnings per share attributable to common stockholders',
-            'net income attributable to common stockholders per common share',
-            'net income per share available to common stockholders'
-        ]
-        
-        table_headers = [
-            'consolidated statements of operations',
-            'consolidated statements of income',
-            'consolidated statements of comprehensive income',
-            'condensed consolidated statements of operations'
-        ]
-
-        # 2. Identify relevant financial tables based on headers
+
+        # 1. Identify relevant financial tables: each header occurrence maps
+        # to the first table starting after it in document order (nested
+        # tables included), like BeautifulSoup's find_next('table').
         target_tables = []
-        for header_text in table_headers:
-            # Find tags that are likely to be headers for the financial statements
-            headers = soup.find_all(lambda tag: tag.name in ['p', 'b', 'strong', 'div'] and header_text in tag.get_text().lower())
-            for header in headers:
-                # Find the table immediately following the header
-                table = header.find_next('table')
-                if table:
-                    target_tables.append(table)
+        for header_text in TABLE_HEADERS:
+            for start in sorted(header_starts[header_text]):
+                pos = bisect.bisect_right(table_starts, start)
+                if pos < len(tables):
+                    target_tables.append(tables[pos][1])
         
-        # 3. Search for EPS values ONLY within the identified tables
+        # 2. Search for EPS values ONLY within the identified tables
         if target_tables:
+            # Several headers can point at the same table; memoize the walked
+            # rows per tag identity so shared tables are only walked once.
+            rows_cache = {}
             for table in target_tables:
-                rows = table.find_all('tr')
-                for i, row in enumerate(rows):
-                    row_text_lower = row.get_text().lower()
-                    
-                    # Find which term is in the row (our potential header row)
-                    matched_term = None
-                    for term in eps_terms:
-                        if term in row_text_lower:
-                            matched_term = term
-                            break
-                    
-                    if matched_term:
-                        # First, try to find the value in the same row as the term.
-                        cells = row.find_all(['td', 'th'])
-                        value_found_in_header_row = False
-                        for cell in cells:
-                            value = extract_eps_value(cell.get_text().strip())
-                            if value is not None:
-                                is_basic = 'basic' in row_text_lower
-                                is_gaap = 'gaap' in row_text_lower or 'unadjusted' in row_text_lower
-                                is_loss = 'loss' in row_text_lower or 'net loss' in row_text_lower
-                                if is_loss and not value.startswith('-'):
-                                    value = '-' + value
-                                found_values.append({'value': value, 'term': matched_term, 'is_basic': is_basic, 'is_gaap': is_gaap})
-                                value_found_in_header_row = True
-                                break # Found value in this row, no need to check other cells
-                        
-                        # If no value was in the header row, search subsections in subsequent rows.
-                        if not value_found_in_header_row:
-                            # Look ahead up to 4 rows for the first numerical value.
-                            for next_row in rows[i+1 : i+5]:
-                                subsection_value_found = False
-                                next_row_text_lower = next_row.get_text().lower()
-                                next_cells = next_row.find_all(['td', 'th'])
-                                for cell in next_cells:
-                                    value = extract_eps_value(cell.get_text().strip())
-                                    if value is not None:
-                                        # This is the first numerical value in a subsequent row.
-                                        is_basic = 'basic' in next_row_text_lower
-                                        is_gaap = 'gaap' in next_row_text_lower or 'unadjusted' in next_row_text_lower
-                                        is_loss = 'loss' in next_row_text_lower or 'net loss' in next_row_text_lower
-                                        if is_loss and not value.startswith('-'):
-                                            value = '-' + value
-                                        
-                                        # Use the original term from the header row.
-                                        found_values.append({'value': value, 'term': matched_term, 'is_basic': is_basic, 'is_gaap': is_gaap})
-                                        subsection_value_found = True
-                                        break # Stop after finding the first value in the row.
-                                
-                                if subsection_value_found:
-                                    break # Stop looking ahead after finding a value in a subsection row.
+                # Walk each table once up front, caching every row's text and
+                # cell texts. get_text() is a recursive descent that rebuilds
+                # a string, and the 4-row lookahead below would otherwise
+                # re-walk the same rows repeatedly.
+                rows_data = rows_cache.get(id(table))
+                if rows_data is None:
+                    rows_data = [
+                        (_element_text(row).lower(),
+                         [_element_text(cell).strip() for cell in row.iter('td', 'th')])
+                        for row in table.iter('tr')
+                    ]
+                    rows_cache[id(table)] = rows_data
+                early_result = _scan_table_rows(rows_data, found_values)
+                if early_result is not None:
+                    return early_result
         
-        # 4. Prioritize and return the best value and term found in tables
+        # 3. Prioritize and return the best value and term found in tables
         if found_values:
             basic_values = [v for v in found_values if v['is_basic']]
             if basic_values: found_values = basic_values
             gaap_values = [v for v in found_values if v['is_gaap']]
             if gaap_values: found_values = gaap_values
             best_result = found_values[0]
-            return best_result['value'], best_result['term']
+            return best_result['value'], EPS_TERMS[best_result['term_id']]
 
         # --- Fallback Search 1: If nothing in tables, search entire text with specific terms ---
-        all_text = soup.get_text()
-        for term in eps_terms:
-            try:
-                # Use finditer to find all occurrences of the term, as whole words
-                matches = re.finditer(r'\b' + re.escape(term) + r'\b', all_text, re.IGNORECASE)
-                for match in matches:
-                    # Look in a window of characters after the term for a number
-                    context = all_text[match.end():match.end() + 100]
-                    
-                    # Regex to find numbers, including parenthesized negatives
-                    number_match = re.search(r'\(?\s*\$?\s*(\d{1,3}(,\d{3})*|\d+)(\.\d{1,2})?\s*\)?', context)
-                    
-                    if number_match:
-                        value = extract_eps_value(number_match.group(0))
-                        if value is not None:
-                            # As soon as we find a plausible value in the fallback, return it.
-                            return value, term
-            except re.error:
-                # Ignore regex errors from complex terms and continue
-                continue
+        # Lowercase the full text once; the term scans below are then plain
+        # case-sensitive matches and the context windows slice this buffer.
+        lowered_text = _element_text(root).lower()
+
+        # Single pass over the text: bucket every whole-word term hit by the
+        # term's priority, then probe the buckets in priority order. The same
+        # 'share'/'eps' literal prefilter as _best_term_id gates the scan.
+        term_hits = {}
+        if 'share' in lowered_text or 'eps' in lowered_text:
+            term_hits = _scan_for_terms(lowered_text, _HS_TERM_DB, _EPS_AUTOMATON,
+                                        _FUSED_TERM_RE, whole_words=True)
+        for priority in sorted(term_hits):
+            term = EPS_TERMS[priority]
+            for end in term_hits[priority]:
+                # Look in a window of characters after the term for a number,
+                # including parenthesized negatives. Searching with pos/endpos
+                # avoids allocating a context slice per hit.
+                number_match = _NUMBER_RE.search(lowered_text, end, end + 100)
+
+                if number_match:
+                    value = extract_eps_value(number_match.group(0))
+                    if value is not None:
+                        # As soon as we find a plausible value in the fallback, return it.
+                        return value, term
 
         # --- Fallback Search 2: Broader "per share" Variations ---
-        fallback_terms = [
-            'per share', 'per basic share', 'per common share', 'per diluted share', 'per common stock'
-        ]
-        for term in fallback_terms:
-            matches = re.finditer(term, all_text, re.IGNORECASE)
-            for match in matches:
-                context = all_text[match.end():match.end() + 50]
-                number_match = re.search(r'\(?\s*\$?\s*(\d{1,3}(,\d{3})*|\d+)(\.\d{1,2})?\s*\)?', context)
+        # Every broad fallback term contains 'per ', the anchor for this scan.
+        fallback_hits = {}
+        if 'per ' in lowered_text:
+            fallback_hits = _scan_for_terms(lowered_text, _HS_FALLBACK_DB,
+                                            _FALLBACK_AUTOMATON, _FUSED_FALLBACK_RE)
+        for priority in sorted(fallback_hits):
+            term = FALLBACK_TERMS[priority]
+            for end in fallback_hits[priority]:
+                number_match = _NUMBER_RE.search(lowered_text, end, end + 50)
                 if number_match:
                     value = extract_eps_value(number_match.group(0))
                     if value is not None:
@@ -206,22 +413,30 @@ def process_directory(input_dir, output_file):
     """
     Processes all HTML files in a directory and writes the extracted EPS data to a CSV file.
     """
-    results = []
-    
-    for filename in os.listdir(input_dir):
-        if filename.endswith('.html'):
-            file_path = os.path.join(input_dir, filename)
-            eps_value, eps_term = find_eps_in_file(file_path)
-            
-            results.append({
-                'filename': filename,
-                'EPS': eps_value if eps_value is not None else 'NONE',
-                'EPS_Term': eps_term if eps_term is not None else 'NONE'
-            })
-    
-    # Create a pandas DataFrame and save it to CSV
-    df = pd.DataFrame(results)
-    df.to_csv(output_file, index=False)
+    # scandir hands back DirEntry objects that already carry the joined path,
+    # avoiding a stat/join per entry compared to os.listdir + os.path.join.
+    with os.scandir(input_dir) as entries:
+        html_entries = [e for e in entries if e.name.endswith('.html')]
+    filenames = [e.name for e in html_entries]
+    file_paths = [e.path for e in html_entries]
+
+    # Stream each row to disk as its worker finishes instead of accumulating
+    # every result in memory first: memory stays O(1) in the corpus size and
+    # the writes overlap with the remaining parsing work.
+    #
+    # Each file is independent CPU-bound work (HTML parse + regex scan), so
+    # fan the files out across all cores. The term lists and compiled pattern
+    # databases are module-level, so each worker builds them once at import
+    # rather than pickling them per task.
+    with open(output_file, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['filename', 'EPS', 'EPS_Term'])
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for filename, (eps_value, eps_term) in zip(
+                    filenames, executor.map(find_eps_in_file, file_paths, chunksize=8)):
+                writer.writerow([filename,
+                                 eps_value if eps_value is not None else 'NONE',
+                                 eps_term if eps_term is not None else 'NONE'])
     print(f"Results written to {output_file}")
 
 def main():